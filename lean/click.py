@@ -257,25 +257,26 @@ def ensure_options(options: List[str]) -> None:
 
     ctx = get_current_context()
 
+    # iterating over the (deduplicated) required options keeps them in the order they were given in
     missing_options = []
-    for key, value in ctx.params.items():
+    for key in dict.fromkeys(options):
+        if key not in ctx.params:
+            continue
+
+        value = ctx.params[key]
         has_value = value is not None
 
         if isinstance(value, tuple) and len(value) == 0:
             has_value = False
 
-        if not has_value and key in options:
+        if not has_value:
             missing_options.append(key)
 
     if len(missing_options) == 0:
         return
 
-    missing_options = sorted(missing_options, key=lambda param: options.index(param))
-    help_records = []
-
-    for name in missing_options:
-        option = next(param for param in ctx.command.params if param.name == name)
-        help_records.append(option.get_help_record(ctx))
+    params_by_name = {param.name: param for param in ctx.command.params}
+    help_records = [params_by_name[name].get_help_record(ctx) for name in missing_options]
 
     from click import HelpFormatter
 
@@ -17,7 +17,6 @@ from typing import Optional
 from click import command, option
 
 from lean.click import LeanCommand, PathParameter
-from lean.constants import PROJECT_CONFIG_FILE_NAME
 from lean.container import container
 
 
@@ -43,5 +42,5 @@ def push(project: Optional[Path]) -> None:
 
         push_manager.push_project(project)
     else:
-        projects_to_push = [p.parent for p in Path.cwd().rglob(PROJECT_CONFIG_FILE_NAME)]
+        projects_to_push = container.project_manager.get_project_directories(Path.cwd())
         push_manager.push_projects(projects_to_push)
@@ -103,8 +103,9 @@ class APIClient:
             self.get("authenticate")
             return True
         except (RequestFailedError, AuthenticationError):
-            from traceback import format_exc
-            self._logger.debug(format_exc().strip())
+            if self._logger.debug_logging_enabled:
+                from traceback import format_exc
+                self._logger.debug(format_exc().strip())
             return False
 
     def _request(self, method: str, endpoint: str, options: Dict[str, Any] = {}, retry_http_5xx: bool = True) -> Any:
@@ -165,7 +166,8 @@ class APIClient:
         :param response: the response of the request
         :return: the data in the response
         """
-        data = response.json()
+        from orjson import loads
+        data = loads(response.content)
 
         if data["success"]:
             return data
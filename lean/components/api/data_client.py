@@ -13,7 +13,8 @@
 
 from lean.components.api.api_client import *
 from lean.models.api import QCDataInformation
-from typing import List, Callable
+from pathlib import Path
+from typing import List, Callable, Optional
 
 
 class DataClient:
@@ -77,13 +78,36 @@ class DataClient:
             makedirs(directory, exist_ok=True)
             move(temp_file_name, local_filename)
 
-    def download_public_file(self, data_endpoint: str) -> bytes:
-        """Downloads the content of a downloadable public file.
+    def download_public_file(self, data_endpoint: str, local_filename: Path, etag: Optional[str] = None) -> Optional[str]:
+        """Downloads a downloadable public file, unless the local copy is still up-to-date.
 
         :param data_endpoint: the url of the public file
-        :return: the content of the file
+        :param local_filename: the final local path where the file will be stored
+        :param etag: the ETag the local copy of the file was downloaded with, if any
+        :return: the ETag of the file now stored in local_filename, or None if the server did not provide one
         """
-        return self._http_client.get(data_endpoint).content
+        from tempfile import NamedTemporaryFile
+        from shutil import move
+
+        # let the server tell us when our local copy is still the latest one, so we don't download it again
+        headers = {"If-None-Match": etag} if etag is not None and local_filename.is_file() else {}
+
+        # we stream the data into a temporary file so a failed download never leaves a truncated file behind
+        with self._http_client.get(data_endpoint, headers=headers, stream=True) as r:
+            if r.status_code == 304:
+                return etag
+
+            with NamedTemporaryFile(delete=False) as f:
+                temp_file_name = f.name
+                for chunk in r.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+
+            new_etag = r.headers.get("ETag", None)
+
+        local_filename.parent.mkdir(parents=True, exist_ok=True)
+        move(temp_file_name, local_filename)
+
+        return new_etag
 
     def list_files(self, prefix: str) -> List[str]:
         """Lists all remote files with a given prefix.
@@ -13,33 +13,35 @@
 
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Any, List, Callable
+from typing import Any, List, Callable, Tuple
 
 from lean.components.api.api_client import APIClient
 from lean.components.config.lean_config_manager import LeanConfigManager
+from lean.components.config.storage import Storage
 from lean.components.util.logger import Logger
+from lean.constants import HTTP_CONNECTION_POOL_SIZE
 from lean.models.errors import MoreInfoError, RequestFailedError
 
 
-def _store_local_file(file_content: bytes, file_path: Path):
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with file_path.open("wb+") as f:
-        f.write(file_content)
-
-
 class DataDownloader:
     """The DataDownloader is responsible for downloading data from QuantConnect Datasets."""
 
-    def __init__(self, logger: Logger, api_client: APIClient, lean_config_manager: LeanConfigManager):
+    def __init__(self,
+                 logger: Logger,
+                 api_client: APIClient,
+                 lean_config_manager: LeanConfigManager,
+                 cache_storage: Storage):
         """Creates a new CloudBacktestRunner instance.
 
         :param logger: the logger to use to log messages with
         :param api_client: the APIClient instance to use when communicating with the QuantConnect API
         :param lean_config_manager: the LeanConfigManager instance to retrieve the data directory from
+        :param cache_storage: the Storage instance to store the ETags of downloaded public files in
         """
         self._logger = logger
         self._api_client = api_client
         self._lean_config_manager = lean_config_manager
+        self._cache_storage = cache_storage
 
     def update_database_files(self):
         """Will update lean data folder database files if required
@@ -51,14 +53,20 @@ class DataDownloader:
             last_update = config["file-database-last-update"] if "file-database-last-update" in config else ''
             if not last_update or now - datetime.strptime(last_update, '%m/%d/%Y') > timedelta(days=1):
                 data_dir = self._lean_config_manager.get_data_directory()
-
-                _store_local_file(self._api_client.data.download_public_file(
-                    "https://raw.githubusercontent.com/QuantConnect/Lean/master/Data/symbol-properties/symbol-properties-database.csv"),
-                    data_dir / "symbol-properties" / "symbol-properties-database.csv")
-                _store_local_file(self._api_client.data.download_public_file(
-                    "https://raw.githubusercontent.com/QuantConnect/Lean/master/Data/market-hours/market-hours-database.json"),
-                    data_dir / "market-hours" / "market-hours-database.json")
-
+                etags = self._cache_storage.get("public-file-etags", {})
+
+                for data_endpoint, local_path in [
+                    ("https://raw.githubusercontent.com/QuantConnect/Lean/master/Data/symbol-properties/symbol-properties-database.csv",
+                     data_dir / "symbol-properties" / "symbol-properties-database.csv"),
+                    ("https://raw.githubusercontent.com/QuantConnect/Lean/master/Data/market-hours/market-hours-database.json",
+                     data_dir / "market-hours" / "market-hours-database.json")
+                ]:
+                    # ETags are stored per local path, the same files may be downloaded to multiple data directories
+                    etags[str(local_path)] = self._api_client.data.download_public_file(data_endpoint,
+                                                                                        local_path,
+                                                                                        etags.get(str(local_path), None))
+
+                self._cache_storage.set("public-file-etags", etags)
                 self._lean_config_manager.set_properties({"file-database-last-update": now.strftime('%m/%d/%Y')})
         except MoreInfoError as e:
             if "not found" in str(e):
@@ -81,24 +89,42 @@ class DataDownloader:
         progress_task = progress.add_task("", total=len(data_files))
 
         try:
-            parallel = Parallel(n_jobs=max(1, cpu_count() - 1), backend="threading")
-
             data_dir = self._lean_config_manager.get_data_directory()
-            parallel(delayed(self._download_file)(data_file.file, overwrite, data_dir, organization_id,
-                                                  lambda advance: progress.update(progress_task, advance=advance))
-                     for data_file in data_files)
+
+            # skip the files we already have up-front so no thread is spent on them
+            files_to_download = []
+            for data_file in data_files:
+                _, canary_path = self._get_download_paths(data_file.file, data_dir)
+                if canary_path.exists() and not overwrite:
+                    self._logger.warn("\n".join([
+                        f"{data_file.file} already exists, use --overwrite to overwrite it",
+                        "You have not been charged for this file"
+                    ]))
+                    progress.update(progress_task, advance=1)
+                else:
+                    files_to_download.append(data_file.file)
+
+            if len(files_to_download) > 0:
+                # downloading is network-bound, so the amount of threads shouldn't be limited by the amount of cores
+                # it is limited by the HTTP connection pool though, any thread beyond it would not get a connection
+                n_jobs = min(len(files_to_download), max(8, cpu_count()), HTTP_CONNECTION_POOL_SIZE)
+                parallel = Parallel(n_jobs=n_jobs, backend="threading")
+                parallel(delayed(self._download_file)(relative_file, data_dir, organization_id,
+                                                      lambda advance: progress.update(progress_task, advance=advance))
+                         for relative_file in files_to_download)
 
             # update our config after we download all files, and not in parallel!
+            # the updates are collected first so the Lean config is only rewritten once
+            config_updates = {}
             for datafile in data_files:
                 relative_file = datafile.file
                 if "/map_files/map_files_" in relative_file and relative_file.endswith(".zip"):
-                    self._lean_config_manager.set_properties({
-                        "map-file-provider": "QuantConnect.Data.Auxiliary.LocalZipMapFileProvider"
-                    })
+                    config_updates["map-file-provider"] = "QuantConnect.Data.Auxiliary.LocalZipMapFileProvider"
                 if "/factor_files/factor_files_" in relative_file and relative_file.endswith(".zip"):
-                    self._lean_config_manager.set_properties({
-                        "factor-file-provider": "QuantConnect.Data.Auxiliary.LocalZipFactorFileProvider"
-                    })
+                    config_updates["factor-file-provider"] = "QuantConnect.Data.Auxiliary.LocalZipFactorFileProvider"
+
+            if len(config_updates) > 0:
+                self._lean_config_manager.set_properties(config_updates)
 
             progress.stop()
         except KeyboardInterrupt as e:
@@ -119,40 +145,39 @@ class DataDownloader:
             return input_string[:-len(suffix)]
         return input_string
 
+    def _get_download_paths(self, relative_file: str, data_directory: Path) -> Tuple[Path, Path]:
+        """Returns the local paths of a file from QuantConnect Datasets.
+
+        :param relative_file: the relative path to the file in the data directory
+        :param data_directory: the path to the local data directory
+        :return: the path the file is downloaded to and the path which exists once the file has been downloaded
+        """
+        local_path = canary_path = data_directory / relative_file
+
+        if self._is_bulk_file(relative_file):
+            # for bulk, we will download to a temporary folder and delete it at the end
+            import tempfile
+            local_path = Path(tempfile.gettempdir()) / relative_file
+            canary_path = Path(self.remove_suffix(str(data_directory / relative_file), ".tar") + ".log")
+
+        return local_path, canary_path
+
+    def _is_bulk_file(self, relative_file: str) -> bool:
+        return "setup/" in relative_file and relative_file.endswith(".tar")
+
     def _download_file(self,
                        relative_file: str,
-                       overwrite: bool,
                        data_directory: Path,
                        organization_id: str,
                        progress_callback: Callable[[float], None]) -> None:
         """Downloads a single file from QuantConnect Datasets to the local data directory.
 
-        If this method downloads a map or factor files zip file,
-        it also updates the Lean config file to ensure LEAN uses those files instead of the csv files.
-
         :param relative_file: the relative path to the file in the data directory
-        :param overwrite: whether existing files may be overwritten
         :param data_directory: the path to the local data directory
         :param organization_id: the id of the organization that should be billed
-        :param callback: the lambda that is called just before the method returns
+        :param progress_callback: the lambda that is called to report download progress
         """
-
-        local_path = canary_path = data_directory / relative_file
-
-        is_bulk = "setup/" in relative_file and relative_file.endswith(".tar")
-        if is_bulk:
-            # for bulk, we will download to a temporary folder and delete it at the end
-            import tempfile
-            local_path = tempfile.gettempdir() + "/" + relative_file
-            canary_path = Path(self.remove_suffix(str(data_directory / relative_file), ".tar") + ".log")
-
-        if canary_path.exists() and not overwrite:
-            self._logger.warn("\n".join([
-                f"{relative_file} already exists, use --overwrite to overwrite it",
-                "You have not been charged for this file"
-            ]))
-            progress_callback(1)
-            return
+        local_path, canary_path = self._get_download_paths(relative_file, data_directory)
 
         try:
             self._api_client.data.download_file(relative_file, organization_id, local_path, progress_callback)
@@ -162,7 +187,7 @@ class DataDownloader:
             return
 
         # Special case: bulk files need unpacked
-        if is_bulk:
+        if self._is_bulk_file(relative_file):
             canary_path.parent.mkdir(parents=True, exist_ok=True)
             with open(canary_path, 'a') as log_file:
                 log_file.write(f'Downloaded: {relative_file}\n')
@@ -111,8 +111,8 @@ class ModuleManager:
         link = self._api_client.modules.get_link(product_id, organization_id, package_file.name)
         try:
             with self._http_client.get(link, stream=True) as response:
-                with package_file.open("wb+") as file:
-                    for chunk in response.iter_content(chunk_size=8192):
+                with package_file.open("wb") as file:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
                         file.write(chunk)
         except Exception as exception:
             package_file.unlink(missing_ok=True)
@@ -135,8 +135,9 @@ class PullManager:
                 self._logger.info(f"[{index}/{len(projects_to_pull)}] Pulling '{project.name}'")
                 projects_with_paths.append((project, self._pull_project(project)))
             except Exception as ex:
-                from traceback import format_exc
-                self._logger.debug(format_exc().strip())
+                if self._logger.debug_logging_enabled:
+                    from traceback import format_exc
+                    self._logger.debug(format_exc().strip())
                 if self._last_file is not None:
                     self._logger.warn(
                         f"Cannot pull '{project.name}' (id {project.projectId}, failed on {self._last_file}): {ex}")
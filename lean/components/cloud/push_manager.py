@@ -73,8 +73,9 @@ class PushManager:
                 self._logger.info(f"[{index}/{len(projects_to_push)}] Pushing '{relative_path}'")
                 self._push_project(path, organization_id)
             except Exception as ex:
-                from traceback import format_exc
-                self._logger.debug(format_exc().strip())
+                if self._logger.debug_logging_enabled:
+                    from traceback import format_exc
+                    self._logger.debug(format_exc().strip())
                 self._logger.warn(f"Cannot push '{relative_path}': {ex}")
 
     def _get_local_libraries_cloud_ids(self, project_dir: Path) -> List[int]:
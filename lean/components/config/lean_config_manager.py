@@ -330,8 +330,13 @@ class LeanConfigManager:
             config = sub(r'/\*.*?\*/|//[^\r\n"]*[\r\n]', '', content)
 
             # let's handle single line comments with double quotes in them
-            new_config = ''
+            new_config = []
             for line in config.split('\n'):
+                # this runs on every command, so only scan the lines which may contain a comment character by character
+                if '/' not in line:
+                    new_config.append(line)
+                    continue
+
                 double_quotes_count = 0
                 previous_element = ''
                 for current_element in line:
@@ -342,9 +347,9 @@ class LeanConfigManager:
                         # count not escaped double quotes
                         if current_element == '"' and previous_element != '\\':
                             double_quotes_count = double_quotes_count + 1
-                        new_config += current_element
+                        new_config.append(current_element)
                     previous_element = current_element
-            result = loads(new_config)
+            result = loads(''.join(new_config))
             return result
 
         except Exception as e:
@@ -123,14 +123,15 @@ class OutputConfigManager:
         :return: The path to the latest output directory for the given environment
         :raises RuntimeError: If no output directory is found for the given environment
         """
-        output_json_files = sorted(Path.cwd().rglob(f"{environment}/*/*.json"),
-                                   key=lambda d: d.stat().st_mtime,
-                                   reverse=True)
+        # a single pass finds the most recent file without sorting or materializing all of them
+        latest_output_json_file = max(Path.cwd().rglob(f"{environment}/*/*.json"),
+                                      key=lambda d: d.stat().st_mtime,
+                                      default=None)
 
-        if len(output_json_files) == 0:
+        if latest_output_json_file is None:
             return None
 
-        return output_json_files[0].parent
+        return latest_output_json_file.parent
 
     def get_output_id(self, output_directory: Path) -> Optional[int]:
         """Returns the id of an output, regardless of whether it is a backtest or a live deployment.
@@ -12,7 +12,10 @@
 # limitations under the License.
 
 
+from threading import Lock
+
 from lean.components.util.logger import Logger
+from lean.constants import HTTP_CONNECTION_POOL_SIZE
 
 
 class HTTPClient:
@@ -24,6 +27,8 @@ class HTTPClient:
         :param logger: the logger to log debug messages with
         """
         self._logger = logger
+        self._session = None
+        self._session_lock = Lock()
 
     def get(self, url: str, **kwargs):
         """A wrapper around requests.get().
@@ -54,16 +59,16 @@ class HTTPClient:
 
         :param method: the request method
         :param url: the request url
-        :param kwargs: any kwargs to pass on to requests.request()
+        :param kwargs: any kwargs to pass on to requests.Session.request()
         :return: the response of the request
         """
-        from requests import request, exceptions
+        from requests import exceptions
 
         self._log_request(method, url, **kwargs)
 
         raise_for_status = kwargs.pop("raise_for_status", True)
         try:
-            response = request(method, url, **kwargs)
+            response = self._get_session().request(method, url, **kwargs)
         except exceptions.SSLError as e:
             raise Exception(f"""
 Detected SSL error, this might be due to custom certificates in your environment or system trust store.
@@ -75,11 +80,38 @@ Related issue https://github.com/psf/requests/issues/2966
         self._check_response(response, raise_for_status)
         return response
 
+    def _get_session(self):
+        """Returns the session to make requests with, creating it on first use.
+
+        Sharing a single session lets requests reuse pooled connections instead of opening a new one every time.
+
+        :return: the requests.Session instance to make requests with
+        """
+        # the session is shared between the threads downloading data files in parallel
+        with self._session_lock:
+            if self._session is None:
+                from requests import Session
+                from requests.adapters import HTTPAdapter
+
+                adapter = HTTPAdapter(pool_maxsize=HTTP_CONNECTION_POOL_SIZE)
+
+                session = Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+
+                self._session = session
+
+        return self._session
+
     def log_unsuccessful_response(self, response) -> None:
         """Logs an unsuccessful response's status code and body.
 
         :param response: the response to log
         """
+        # avoid decoding the body when the message would be discarded anyway
+        if not self._logger.debug_logging_enabled:
+            return
+
         body = f"body:\n{response.text}" if response.text != "" else "empty body"
         self._logger.debug(f"Request was not successful, status code {response.status_code}, {body}")
 
@@ -90,6 +122,10 @@ Related issue https://github.com/psf/requests/issues/2966
         :param url: the request url
         :param kwargs: any kwargs passed to a request.* method
         """
+        # avoid serializing the request data when the message would be discarded anyway
+        if not self._logger.debug_logging_enabled:
+            return
+
         from json import dumps
         message = f"--> {method.upper()} {url}"
 
@@ -106,7 +142,9 @@ Related issue https://github.com/psf/requests/issues/2966
         :param raise_for_status: True if an error needs to be raised if the request wasn't successful, False if not
         """
         if response.status_code < 200 or response.status_code >= 300:
-            self.log_unsuccessful_response(response)
+            # a 304 is the expected answer to a conditional request whose cached copy is still up-to-date
+            if response.status_code != 304 or "If-None-Match" not in response.request.headers:
+                self.log_unsuccessful_response(response)
 
         if raise_for_status:
             response.raise_for_status()
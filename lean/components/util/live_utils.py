@@ -33,7 +33,7 @@ def _get_last_portfolio(api_client: APIClient, project_id: str, project_name: Pa
     local_last_time = utc.localize(datetime.min)
     live_deployment_path = f"{project_name}/live"
     if path.isdir(live_deployment_path):
-        local_deployment_time = [datetime.strptime(subdir, "%Y-%m-%d_%H-%M-%S").astimezone().astimezone(UTC) for subdir in listdir(live_deployment_path)]
+        local_deployment_time = [datetime.strptime(subdir, "%Y-%m-%d_%H-%M-%S").astimezone(UTC) for subdir in listdir(live_deployment_path)]
         if local_deployment_time:
             local_last_time = sorted(local_deployment_time, reverse = True)[0]
 
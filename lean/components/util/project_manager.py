@@ -13,7 +13,7 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Union, Tuple
+from typing import Dict, List, Optional, Union, Tuple
 from lean.components import reserved_names
 from lean.components.config.lean_config_manager import LeanConfigManager
 from lean.components.config.project_config_manager import ProjectConfigManager
@@ -50,6 +50,7 @@ class ProjectManager:
         self._path_manager = path_manager
         self._xml_manager = xml_manager
         self._platform_manager = platform_manager
+        self._cloud_id_cache: Dict[Path, Tuple[Tuple[int, int], Optional[int]]] = {}
 
     def find_algorithm_file(self, input: Path) -> Path:
         """Returns the path to the file containing the algorithm.
@@ -103,38 +104,93 @@ class ProjectManager:
             directory = directories.pop(0)
 
             try:
-                project_config = self._project_config_manager.get_project_config(directory)
+                project_cloud_id = self._get_cloud_id(directory)
             except:
                 continue
-            if project_config and project_config.get("cloud-id", None) == cloud_id:
+            if project_cloud_id is not None and project_cloud_id == cloud_id:
                 return directory
             else:
                 directories.extend(d for d in directory.iterdir() if d.is_dir())
 
         return False
 
+    def _get_cloud_id(self, project_dir: Path) -> Optional[int]:
+        """Returns the cloud id of a project.
+
+        The cloud id is cached until the modification time or size of the project config file changes,
+        so repeated lookups don't have to read and parse the config of every project again.
+
+        :param project_dir: the path to the project directory
+        :return: the cloud id of the project, or None if it has no cloud id or is not a project
+        """
+        try:
+            stat = (project_dir / PROJECT_CONFIG_FILE_NAME).stat()
+        except OSError:
+            return None
+
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        cached_entry = self._cloud_id_cache.get(project_dir)
+        if cached_entry is not None and cached_entry[0] == file_version:
+            return cached_entry[1]
+
+        cloud_id = self._project_config_manager.get_project_config(project_dir).get("cloud-id", None)
+        self._cloud_id_cache[project_dir] = (file_version, cloud_id)
+
+        return cloud_id
+
     def get_source_files(self, directory: Path) -> List[Path]:
         """Returns the paths of all the source files in a directory.
 
         :param directory: the path to the directory to get the source files of
         :return: the list of source files in the given project directory
         """
+        from os import scandir
+
         source_files = []
 
-        for obj in directory.iterdir():
-            if obj.is_dir():
-                if obj.name in ["bin", "obj", ".ipynb_checkpoints", "backtests", "live", "optimizations"]:
-                    continue
+        # scandir's entries cache the file type, saving a stat call per entry compared to Path.iterdir()
+        with scandir(directory) as entries:
+            for entry in entries:
+                obj = directory / entry.name
 
-                source_files.extend(self.get_source_files(obj))
+                if entry.is_dir():
+                    if entry.name in ["bin", "obj", ".ipynb_checkpoints", "backtests", "live", "optimizations"]:
+                        continue
 
-            if obj.suffix not in [".py", ".cs", ".ipynb"]:
-                continue
+                    source_files.extend(self.get_source_files(obj))
 
-            source_files.append(obj)
+                if obj.suffix not in [".py", ".cs", ".ipynb"]:
+                    continue
+
+                source_files.append(obj)
 
         return source_files
 
+    def get_project_directories(self, directory: Path) -> List[Path]:
+        """Returns the paths of all the project directories in a directory, recursively.
+
+        :param directory: the path to the directory to search for projects in
+        :return: the list of directories containing a project config file
+        """
+        from os import scandir
+
+        project_directories = []
+
+        try:
+            entries = scandir(directory)
+        except PermissionError:
+            # skip directories we aren't allowed to read, like Path.rglob() does
+            return project_directories
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    project_directories.extend(self.get_project_directories(directory / entry.name))
+                elif entry.name == PROJECT_CONFIG_FILE_NAME:
+                    project_directories.append(directory)
+
+        return project_directories
+
     def update_last_modified_time(self, local_file_path: Path, cloud_timestamp: datetime) -> None:
         """Updates the last modified time of a local path to that of the cloud counterpart.
 
@@ -142,11 +198,12 @@ class ProjectManager:
         :param cloud_timestamp: the last modified time of the counterpart of the local file in the cloud
         """
         from os import utime
-        from datetime import timezone
+        from datetime import timedelta, timezone
 
-        # Timestamps are stored in UTC in the cloud, but utime() requires them in the local timezone
-        time = cloud_timestamp.replace(tzinfo=timezone.utc).astimezone(tz=None)
-        time = round(time.timestamp() * 1e9)
+        # Timestamps are stored in UTC in the cloud, marking them as such is enough to get the epoch offset,
+        # converting to the local timezone first isn't needed and integer math keeps the nanoseconds exact
+        time = cloud_timestamp.replace(tzinfo=timezone.utc) - datetime(1970, 1, 1, tzinfo=timezone.utc)
+        time = (time // timedelta(microseconds=1)) * 1000
         utime(local_file_path, ns=(time, time))
 
     def copy_code(self, project_dir: Path, output_dir: Path) -> None:
@@ -251,8 +308,21 @@ class ProjectManager:
             raise RuntimeError(f"Failed to rename project. Could not find the specified path {old_path}.")
         if old_path == new_path:
             return
+        from errno import EXDEV
         from shutil import move
-        move(old_path, new_path)
+        if new_path.exists():
+            # let shutil.move handle moving into an existing directory and case-only renames
+            move(old_path, new_path)
+        else:
+            # shutil.move copies the entire project whenever os.rename fails, for example because the new parent
+            # directory doesn't exist yet, so create the parent and rename, only copying across file systems
+            new_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                old_path.replace(new_path)
+            except OSError as error:
+                if error.errno != EXDEV:
+                    raise
+                move(old_path, new_path)
         self._rename_csproj_file(new_path)
 
     def get_projects_by_name_or_id(self, cloud_projects: List[QCProject],
@@ -651,8 +721,7 @@ class ProjectManager:
         if not ssh_dir.exists():
             ssh_dir.mkdir(parents=True)
             for name in ["key", "key.pub", "README.md"]:
-                with (ssh_dir / name).open("wb+") as file:
-                    file.write(resource_string("lean", f"ssh/{name}"))
+                (ssh_dir / name).write_bytes(resource_string("lean", f"ssh/{name}"))
 
         # Find Rider's global configuration directory
         for directory in self._get_jetbrains_config_dirs("Rider"):
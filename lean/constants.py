@@ -99,3 +99,7 @@ TERMINAL_LINK_PRODUCT_ID = 44
 
 # The name of the Docker network which all Lean CLI containers are ran on
 DOCKER_NETWORK = "lean_cli"
+
+# The maximum amount of connections the HTTP client keeps open per host
+# Data files are downloaded in parallel using at most this many threads, so no connection is ever discarded
+HTTP_CONNECTION_POOL_SIZE = 32
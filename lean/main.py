@@ -105,7 +105,8 @@ def main() -> None:
         from lean.models.errors import MoreInfoError
 
         logger = container.logger
-        logger.debug(format_exc().strip())
+        if logger.debug_logging_enabled:
+            logger.debug(format_exc().strip())
 
         if isinstance(exception, ValidationError) and hasattr(exception, "input_value"):
             logger.debug("Value that failed validation:")
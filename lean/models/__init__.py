@@ -12,11 +12,13 @@
 # limitations under the License.
 
 from os import path
-from json import load
 from pathlib import Path
 from time import time
 
+from orjson import loads
+
 json_modules = {}
+data = None
 file_name = "modules-1.11.json"
 directory = Path(__file__).parent
 file_path = directory.parent / file_name
@@ -30,12 +32,11 @@ try:
         from requests import get
         res = get(url, timeout=5)
         if res.ok:
-            new_content = res.json()
-            from json import dump
+            # parse once to validate the content, then store the raw bytes so we don't serialize and re-read it
+            data = loads(res.content)
             # create parents if not exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                dump(new_content, f, ensure_ascii=False, indent=4)
+            file_path.write_bytes(res.content)
         else:
             res.raise_for_status()
 except Exception as e:
@@ -43,12 +44,13 @@ except Exception as e:
     error = str(e)
     pass
 
-# check if file exists
-if not Path(file_path).is_file():
-    error_message = f": {error}" if error is not None else ""
-    raise FileNotFoundError(
-        f"Modules json not found in the given path {file_path}{error_message}")
+if data is None:
+    # check if file exists
+    if not Path(file_path).is_file():
+        error_message = f": {error}" if error is not None else ""
+        raise FileNotFoundError(
+            f"Modules json not found in the given path {file_path}{error_message}")
+
+    data = loads(file_path.read_bytes())
 
-with open(file_path) as f:
-    data = load(f)
-    json_modules = data['modules']
+json_modules = data['modules']
@@ -450,10 +450,14 @@ class QCResolution(str, Enum):
         :param name: the name of the enum member (case insensitive)
         :return: the matching enum member
         """
-        for k, v in cls.__members__.items():
-            if k.lower() == name.lower():
-                return v
-        raise ValueError(f"QCResolution has no member named '{name}'")
+        member = _resolutions_by_lower_name.get(name.lower())
+        if member is None:
+            raise ValueError(f"QCResolution has no member named '{name}'")
+        return member
+
+
+# precomputed once so QCResolution.by_name() is a dict lookup instead of a scan over all members
+_resolutions_by_lower_name = {k.lower(): v for k, v in QCResolution.__members__.items()}
 
 
 class QCLink(WrappedBaseModel):
@@ -57,6 +57,7 @@ install_requires = [
     "maskpass>=0.3.6",
     "joblib>=1.1.0",
     "wrapt~=1.14.1",
+    "orjson>=3.8.0",
     "setuptools",
     f"quantconnect-stubs{get_stubs_version_range()}"
 ]
@@ -15,10 +15,12 @@ import contextlib
 import os
 from datetime import datetime
 from time import sleep
+from pathlib import Path
 from typing import ContextManager
 from unittest import mock
 
 import pytest
+import requests
 from responses import RequestsMock
 
 from lean.components.api.account_client import AccountClient
@@ -320,3 +322,74 @@ def test_data_client_get_info() -> None:
     # Test data information can be parsed
     preferred_organization = account_client.get_organization()
     data_client.get_info(preferred_organization.organizationId)
+
+
+PUBLIC_FILE_URL = "https://example.com/market-hours-database.json"
+
+
+def test_data_client_download_public_file_stores_content(requests_mock: RequestsMock) -> None:
+    requests_mock.add(requests_mock.GET, PUBLIC_FILE_URL, "new content")
+
+    local_filename = Path.cwd() / "data" / "market-hours" / "market-hours-database.json"
+
+    data_client = DataClient(mock.Mock(), HTTPClient(mock.Mock()))
+    data_client.download_public_file(PUBLIC_FILE_URL, local_filename)
+
+    assert local_filename.read_text(encoding="utf-8") == "new content"
+
+
+def test_data_client_download_public_file_keeps_existing_file_when_request_fails(requests_mock: RequestsMock) -> None:
+    requests_mock.add(requests_mock.GET, PUBLIC_FILE_URL, "Internal Server Error", status=500)
+
+    local_filename = Path.cwd() / "market-hours-database.json"
+    local_filename.write_text("old content", encoding="utf-8")
+
+    data_client = DataClient(mock.Mock(), HTTPClient(mock.Mock()))
+
+    with pytest.raises(requests.HTTPError):
+        data_client.download_public_file(PUBLIC_FILE_URL, local_filename)
+
+    assert local_filename.read_text(encoding="utf-8") == "old content"
+
+
+def test_data_client_download_public_file_returns_etag(requests_mock: RequestsMock) -> None:
+    requests_mock.add(requests_mock.GET, PUBLIC_FILE_URL, "new content", headers={"ETag": '"new-etag"'})
+
+    local_filename = Path.cwd() / "market-hours-database.json"
+    local_filename.write_text("old content", encoding="utf-8")
+
+    data_client = DataClient(mock.Mock(), HTTPClient(mock.Mock()))
+    etag = data_client.download_public_file(PUBLIC_FILE_URL, local_filename, '"old-etag"')
+
+    assert etag == '"new-etag"'
+    assert local_filename.read_text(encoding="utf-8") == "new content"
+    assert requests_mock.calls[0].request.headers["If-None-Match"] == '"old-etag"'
+
+
+def test_data_client_download_public_file_keeps_file_when_not_modified(requests_mock: RequestsMock) -> None:
+    requests_mock.add(requests_mock.GET, PUBLIC_FILE_URL, status=304)
+
+    local_filename = Path.cwd() / "market-hours-database.json"
+    local_filename.write_text("old content", encoding="utf-8")
+
+    logger = mock.Mock()
+    data_client = DataClient(mock.Mock(), HTTPClient(logger))
+    etag = data_client.download_public_file(PUBLIC_FILE_URL, local_filename, '"old-etag"')
+
+    assert etag == '"old-etag"'
+    assert local_filename.read_text(encoding="utf-8") == "old content"
+
+    # only the request is logged, the expected 304 is not logged as an unsuccessful response
+    logger.debug.assert_called_once()
+
+
+def test_data_client_download_public_file_ignores_etag_when_file_missing(requests_mock: RequestsMock) -> None:
+    requests_mock.add(requests_mock.GET, PUBLIC_FILE_URL, "new content")
+
+    local_filename = Path.cwd() / "market-hours-database.json"
+
+    data_client = DataClient(mock.Mock(), HTTPClient(mock.Mock()))
+    data_client.download_public_file(PUBLIC_FILE_URL, local_filename, '"old-etag"')
+
+    assert "If-None-Match" not in requests_mock.calls[0].request.headers
+    assert local_filename.read_text(encoding="utf-8") == "new content"
@@ -0,0 +1,111 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean CLI v1.0. Copyright 2021 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest import mock
+
+from lean.components.cloud.data_downloader import DataDownloader
+from lean.components.config.storage import Storage
+from lean.constants import HTTP_CONNECTION_POOL_SIZE
+
+
+def _create_data_downloader(api_client: mock.Mock, cache_storage: Storage, logger: mock.Mock = None) -> DataDownloader:
+    lean_config_manager = mock.Mock()
+    lean_config_manager.get_lean_config.return_value = {}
+    lean_config_manager.get_data_directory.return_value = Path.cwd() / "data"
+
+    return DataDownloader(logger or mock.Mock(), api_client, lean_config_manager, cache_storage)
+
+
+def test_update_database_files_passes_and_stores_etags() -> None:
+    data_dir = Path.cwd() / "data"
+    symbol_properties_path = data_dir / "symbol-properties" / "symbol-properties-database.csv"
+    market_hours_path = data_dir / "market-hours" / "market-hours-database.json"
+
+    cache_storage = Storage(str(Path("~/.lean/cache").expanduser()))
+    cache_storage.set("public-file-etags", {str(symbol_properties_path): '"old-etag"'})
+
+    api_client = mock.Mock()
+    api_client.data.download_public_file.side_effect = ['"old-etag"', '"new-etag"']
+
+    data_downloader = _create_data_downloader(api_client, cache_storage)
+    data_downloader.update_database_files()
+
+    calls = api_client.data.download_public_file.call_args_list
+    assert calls[0].args[1:] == (symbol_properties_path, '"old-etag"')
+    assert calls[1].args[1:] == (market_hours_path, None)
+
+    assert cache_storage.get("public-file-etags") == {
+        str(symbol_properties_path): '"old-etag"',
+        str(market_hours_path): '"new-etag"'
+    }
+
+
+def test_download_files_skips_existing_files_when_not_overwriting() -> None:
+    existing_file = Path.cwd() / "data" / "equity" / "usa" / "daily" / "aapl.zip"
+    existing_file.parent.mkdir(parents=True)
+    existing_file.touch()
+
+    logger = mock.Mock()
+    progress = logger.progress.return_value
+    progress_task = progress.add_task.return_value
+
+    api_client = mock.Mock()
+    data_downloader = _create_data_downloader(api_client, mock.Mock(), logger)
+
+    data_downloader.download_files([mock.Mock(file="equity/usa/daily/aapl.zip")], False, "abc")
+
+    api_client.data.download_file.assert_not_called()
+    logger.warn.assert_called_once()
+    assert "equity/usa/daily/aapl.zip already exists" in logger.warn.call_args.args[0]
+    progress.update.assert_called_once_with(progress_task, advance=1)
+
+
+def test_download_files_downloads_existing_files_when_overwriting() -> None:
+    existing_file = Path.cwd() / "data" / "equity" / "usa" / "daily" / "aapl.zip"
+    existing_file.parent.mkdir(parents=True)
+    existing_file.touch()
+
+    api_client = mock.Mock()
+    data_downloader = _create_data_downloader(api_client, mock.Mock())
+
+    data_downloader.download_files([mock.Mock(file="equity/usa/daily/aapl.zip")], True, "abc")
+
+    api_client.data.download_file.assert_called_once()
+    assert api_client.data.download_file.call_args.args[:3] == ("equity/usa/daily/aapl.zip", "abc", existing_file)
+
+
+def test_download_files_skips_bulk_files_which_have_been_unpacked() -> None:
+    canary_file = Path.cwd() / "data" / "setup" / "equity.log"
+    canary_file.parent.mkdir(parents=True)
+    canary_file.touch()
+
+    api_client = mock.Mock()
+    data_downloader = _create_data_downloader(api_client, mock.Mock())
+
+    data_downloader.download_files([mock.Mock(file="setup/equity.tar")], False, "abc")
+
+    api_client.data.download_file.assert_not_called()
+
+
+def test_download_files_limits_threads_to_connection_pool_size() -> None:
+    data_files = [mock.Mock(file=f"equity/usa/daily/{i}.zip") for i in range(HTTP_CONNECTION_POOL_SIZE * 2)]
+
+    api_client = mock.Mock()
+    data_downloader = _create_data_downloader(api_client, mock.Mock())
+
+    with mock.patch("multiprocessing.cpu_count", return_value=HTTP_CONNECTION_POOL_SIZE * 4), \
+            mock.patch("joblib.Parallel") as parallel:
+        data_downloader.download_files(data_files, False, "abc")
+
+    assert parallel.call_args.kwargs["n_jobs"] == HTTP_CONNECTION_POOL_SIZE
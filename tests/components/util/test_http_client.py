@@ -18,6 +18,7 @@ import requests
 from responses import RequestsMock
 
 from lean.components.util.http_client import HTTPClient
+from lean.constants import HTTP_CONNECTION_POOL_SIZE
 
 EXAMPLE_URL = "https://example.com/"
 
@@ -115,3 +116,40 @@ def test_http_client_logs_debug_message_about_response_when_unsuccessful(request
             getattr(http_client, method)(EXAMPLE_URL)
 
     assert logger.debug.call_count == 2
+
+
+@pytest.mark.parametrize("status", [200, 404])
+def test_http_client_does_not_log_when_debug_logging_disabled(requests_mock: RequestsMock, status: int) -> None:
+    requests_mock.add("POST", EXAMPLE_URL, "Example body", status=status)
+
+    logger = mock.Mock()
+    logger.debug_logging_enabled = False
+    http_client = HTTPClient(logger)
+
+    http_client.post(EXAMPLE_URL, json={"key": "value"}, raise_for_status=False)
+
+    logger.debug.assert_not_called()
+
+
+def test_http_client_reuses_session_between_requests(requests_mock: RequestsMock) -> None:
+    requests_mock.add("GET", EXAMPLE_URL, "Example body")
+    requests_mock.add("POST", EXAMPLE_URL, "Example body")
+
+    http_client = HTTPClient(mock.Mock())
+
+    session_request = requests.Session.request
+    with mock.patch.object(requests.Session, "request", autospec=True, side_effect=session_request) as request:
+        http_client.get(EXAMPLE_URL)
+        http_client.post(EXAMPLE_URL)
+
+    # both requests go through the same session, so they share its connection pool
+    assert request.call_count == 2
+    assert request.call_args_list[0].args[0] is request.call_args_list[1].args[0]
+
+
+def test_http_client_pool_fits_parallel_downloads() -> None:
+    http_client = HTTPClient(mock.Mock())
+
+    adapter = http_client._get_session().get_adapter(EXAMPLE_URL)
+
+    assert adapter._pool_maxsize == HTTP_CONNECTION_POOL_SIZE
@@ -29,7 +29,8 @@ from lean.components.util.project_manager import ProjectManager
 from lean.components.util.xml_manager import XMLManager
 from lean.container import container
 from lean.models.api import QCLanguage, QCProjectLibrary, QCProject
-from tests.test_helpers import create_fake_lean_cli_directory, create_api_project
+from tests.test_helpers import create_fake_lean_cli_directory, create_fake_lean_cli_directory_with_subdirectories, \
+    create_api_project
 
 
 def _create_project_manager() -> ProjectManager:
@@ -121,6 +122,35 @@ def test_get_project_by_id_raises_error_when_no_project_with_given_id_exists() -
         project_manager.get_project_by_id(max(python_project_id, csharp_project_id) + 1)
 
 
+def test_try_get_project_path_by_cloud_id_returns_path_to_project_with_given_cloud_id() -> None:
+    create_fake_lean_cli_directory()
+
+    project_config_manager = ProjectConfigManager(XMLManager())
+    project_config_manager.get_project_config(Path.cwd() / "Python Project").set("cloud-id", 1)
+    project_config_manager.get_project_config(Path.cwd() / "CSharp Project").set("cloud-id", 2)
+
+    project_manager = _create_project_manager()
+
+    assert project_manager.try_get_project_path_by_cloud_id(2) == Path.cwd() / "CSharp Project"
+    assert not project_manager.try_get_project_path_by_cloud_id(3)
+
+
+def test_try_get_project_path_by_cloud_id_detects_modified_project_config() -> None:
+    create_fake_lean_cli_directory()
+
+    project_config_manager = ProjectConfigManager(XMLManager())
+    project_config = project_config_manager.get_project_config(Path.cwd() / "Python Project")
+    project_config.set("cloud-id", 1)
+
+    project_manager = _create_project_manager()
+    assert project_manager.try_get_project_path_by_cloud_id(1) == Path.cwd() / "Python Project"
+
+    project_config.set("cloud-id", 123)
+
+    assert not project_manager.try_get_project_path_by_cloud_id(1)
+    assert project_manager.try_get_project_path_by_cloud_id(123) == Path.cwd() / "Python Project"
+
+
 def test_get_source_files_returns_all_source_files() -> None:
     project_path = Path.cwd() / "My Project"
     project_path.mkdir()
@@ -154,6 +184,51 @@ def test_get_source_files_ignores_generated_source_files(directory: str) -> None
     assert files_to_sync == [files[0]]
 
 
+def test_get_project_directories_returns_all_project_directories() -> None:
+    create_fake_lean_cli_directory_with_subdirectories(2)
+
+    project_manager = _create_project_manager()
+    project_directories = project_manager.get_project_directories(Path.cwd())
+
+    assert sorted(project_directories) == sorted([Path.cwd() / "Subdir0/Subdir1/Python Project",
+                                                  Path.cwd() / "Subdir0/Subdir1/CSharp Project",
+                                                  Path.cwd() / "Library/Python Library",
+                                                  Path.cwd() / "Library/CSharp Library"])
+
+
+def test_get_project_directories_skips_unreadable_directories() -> None:
+    create_fake_lean_cli_directory_with_subdirectories(2)
+
+    from os import scandir
+    unreadable_directory = Path.cwd() / "Subdir0"
+
+    def scandir_side_effect(directory):
+        if Path(directory) == unreadable_directory:
+            raise PermissionError(f"[Errno 13] Permission denied: '{directory}'")
+        return scandir(directory)
+
+    project_manager = _create_project_manager()
+    with mock.patch("os.scandir", side_effect=scandir_side_effect):
+        project_directories = project_manager.get_project_directories(Path.cwd())
+
+    assert sorted(project_directories) == sorted([Path.cwd() / "Library/Python Library",
+                                                  Path.cwd() / "Library/CSharp Library"])
+
+
+def test_rename_project_and_contents_moves_project_to_new_path() -> None:
+    create_fake_lean_cli_directory()
+
+    old_path = Path.cwd() / "Python Project"
+    new_path = Path.cwd() / "Renamed" / "Python Project"
+
+    project_manager = _create_project_manager()
+    project_manager.rename_project_and_contents(old_path, new_path)
+
+    assert not old_path.exists()
+    assert (new_path / "main.py").is_file()
+    assert (new_path / "config.json").is_file()
+
+
 def test_update_last_modified_time_updates_file_properties() -> None:
     local_file = Path.cwd() / "file.txt"
     local_file.touch()